@@ -98,6 +98,9 @@ class Settings(BaseSettings):
 
     # Registry configuration
     registry_proxy_auth_enabled: bool = True
+    # Maximum number of transfer pipelines (skopeo pull → scan → push) running
+    # at once; extra jobs stay pending until a slot frees up.
+    transfer_parallelism: int = 4
 
     # Vulnerability scanning configuration
     # Master kill-switch: when TRIVY_ENABLED=false the embedded Trivy server is
@@ -27,13 +27,18 @@ def is_local_registry_host(host: str) -> bool:
     return bare == REGISTRY_HOST
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def bytes_to_human(size_bytes: float) -> str:
     """Convert bytes to a human-readable string."""
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # bit_length picks the 1024-power directly instead of dividing in a loop.
+    idx = (
+        min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        if size_bytes >= 1024
+        else 0
+    )
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def resolve_safe_path(full_path: str, frontend_dist: Path) -> Path | None:
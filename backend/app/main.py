@@ -43,7 +43,9 @@ from .routers.folders import (
     ensure_root_folder_exists,
     migrate_folder_permissions_to_groups,
 )
+from .routers.registry_proxy import audit_worker, close_proxy_client
 from .security import AuditMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
+from .services.providers.base import close_shared_clients
 from .services.proxy_service import (
     apply_proxy_to_os_environ,
     apply_syslog_config,
@@ -77,7 +79,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     db_task = (
         asyncio.create_task(db_updater_loop()) if app_settings.trivy_enabled else None
     )
+    audit_task = asyncio.create_task(audit_worker())
     yield
+    audit_task.cancel()
+    try:
+        await audit_task
+    except asyncio.CancelledError:
+        pass
     if db_task is not None:
         db_task.cancel()
         try:
@@ -85,6 +93,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except asyncio.CancelledError:
             pass
         logger.info("Trivy DB updater task stopped.")
+    await close_shared_clients()
+    await close_proxy_client()
 
 
 app = FastAPI(
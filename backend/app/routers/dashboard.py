@@ -174,7 +174,7 @@ async def get_dashboard_stats(
 
     # Disk usage
     try:
-        disk = shutil.disk_usage("/")
+        disk = await asyncio.to_thread(shutil.disk_usage, "/")
         disk_total = disk.total
         disk_used = disk.used
         disk_free = disk.free
@@ -29,7 +29,13 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 from ..config import DATA_DIR
 from ..core.jwt import UserInfo, get_current_user, require_admin
@@ -57,6 +63,8 @@ class FolderPermission(BaseModel):
     time; it is never persisted and may be None if the group was deleted.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     group_id: str
     group_name: str | None = None
     can_pull: bool = False
@@ -71,20 +79,40 @@ class FolderPermission(BaseModel):
     # writes to the local embedded registry).
     can_push_external: bool = False
 
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_group_name(cls, data: Any) -> Any:
+        """Fill the display group_name from the stored group id."""
+        if isinstance(data, dict) and "group_id" in data:
+            return {**data, "group_name": group_name_for_id(data["group_id"])}
+        return data
+
 
 class Folder(BaseModel):
     """A registry folder with its associated user permissions."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str = ""
-    created_at: str
+    created_at: str = ""
     permissions: list[FolderPermission] = []
 
+    @field_validator("permissions", mode="before")
+    @classmethod
+    def drop_legacy_permissions(cls, v: Any) -> Any:
+        """Skip stored entries that are not keyed by group (pre-migration data)."""
+        if isinstance(v, list):
+            return [p for p in v if not isinstance(p, dict) or "group_id" in p]
+        return v
+
 
 class CreateFolderRequest(BaseModel):
     """Payload to create a new folder."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     description: str = ""
 
@@ -106,12 +134,16 @@ class CreateFolderRequest(BaseModel):
 class UpdateFolderRequest(BaseModel):
     """Payload to update a folder's description."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     description: str = ""
 
 
 class SetPermissionRequest(BaseModel):
     """Payload to set or update a group's permissions on a folder."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     group_id: str
     can_pull: bool = False
     can_pull_external: bool = False
@@ -146,26 +178,8 @@ def _save_folders(folders: list[dict[str, Any]]) -> None:
     _FOLDERS_FILE.write_text(json.dumps(folders, indent=2))
 
 
-def _dict_to_folder(d: dict[str, Any]) -> Folder:
-    """Convert a raw dict (from JSON) to a Folder model."""
-    return Folder(
-        id=d["id"],
-        name=d["name"],
-        description=d.get("description", ""),
-        created_at=d.get("created_at", ""),
-        permissions=[
-            FolderPermission(
-                group_id=p["group_id"],
-                group_name=group_name_for_id(p["group_id"]),
-                can_pull=p.get("can_pull", False),
-                can_pull_external=p.get("can_pull_external", False),
-                can_push=p.get("can_push", False),
-                can_push_external=p.get("can_push_external", False),
-            )
-            for p in d.get("permissions", [])
-            if "group_id" in p
-        ],
-    )
+# Validates the whole stored folder list in one pass for list_folders.
+_FOLDER_LIST_ADAPTER = TypeAdapter(list[Folder])
 
 
 # ── Migration helper ──────────────────────────────────────────────────────────
@@ -347,7 +361,7 @@ def has_external_push_access(username: str) -> bool:
 @router.get("", response_model=list[Folder])
 async def list_folders(_: UserInfo = Depends(require_admin)) -> list[Folder]:
     """Return all folders. Requires admin."""
-    return [_dict_to_folder(f) for f in _load_folders()]
+    return _FOLDER_LIST_ADAPTER.validate_python(_load_folders())
 
 
 @router.post("", response_model=Folder, status_code=status.HTTP_201_CREATED)
@@ -374,7 +388,7 @@ async def create_folder(
     }
     folders.append(entry)
     _save_folders(folders)
-    return _dict_to_folder(entry)
+    return Folder.model_validate(entry)
 
 
 @router.patch("/{folder_id}", response_model=Folder)
@@ -392,7 +406,7 @@ async def update_folder(
         if f["id"] == folder_id:
             f["description"] = payload.description
             _save_folders(folders)
-            return _dict_to_folder(f)
+            return Folder.model_validate(f)
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND, detail="Folder not found"
     )
@@ -448,7 +462,7 @@ async def set_permission(
                     p["can_push"] = payload.can_push
                     p["can_push_external"] = payload.can_push_external
                     _save_folders(folders)
-                    return _dict_to_folder(f)
+                    return Folder.model_validate(f)
             perms.append(
                 {
                     "group_id": payload.group_id,
@@ -459,7 +473,44 @@ async def set_permission(
                 }
             )
             _save_folders(folders)
-            return _dict_to_folder(f)
+            return Folder.model_validate(f)
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Folder not found"
+    )
+
+
+@router.put("/{folder_id}/permissions:batch", response_model=Folder)
+async def set_permissions_batch(
+    folder_id: str,
+    payload: list[SetPermissionRequest],
+    _: UserInfo = Depends(require_admin),
+) -> Folder:
+    """Set or update several groups' permissions on a folder at once. Requires admin.
+
+    Entries are merged by group id (the last entry wins on duplicates) and the
+    folders file is written once for the whole batch instead of once per group.
+    """
+    folders = _load_folders()
+    for f in folders:
+        if f["id"] == folder_id:
+            perms: list[dict[str, Any]] = f.setdefault("permissions", [])
+            # Existing entries are updated in place and entries without a
+            # group_id are kept as-is, exactly like the single-entry endpoint.
+            by_group: dict[str, dict[str, Any]] = {
+                p["group_id"]: p for p in perms if "group_id" in p
+            }
+            for entry in payload:
+                p = by_group.get(entry.group_id)
+                if p is None:
+                    p = {"group_id": entry.group_id}
+                    perms.append(p)
+                    by_group[entry.group_id] = p
+                p["can_pull"] = entry.can_pull
+                p["can_pull_external"] = entry.can_pull_external
+                p["can_push"] = entry.can_push
+                p["can_push_external"] = entry.can_push_external
+            _save_folders(folders)
+            return Folder.model_validate(f)
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND, detail="Folder not found"
     )
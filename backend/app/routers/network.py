@@ -23,6 +23,7 @@ from fastapi import APIRouter, Depends
 from ..config import Settings, get_settings
 from ..core.jwt import UserInfo, require_admin
 from ..services.email_service import send_audit_log_email, send_test_email
+from ..services.providers.base import close_shared_clients
 from ..services.proxy_service import (
     EmailSettings,
     NetworkConfig,
@@ -87,6 +88,8 @@ async def save_proxy_override(
 
     # Write (or clear) the proxy values in the running process environment
     apply_proxy_to_os_environ(payload)
+    # Pooled registry clients captured the previous proxy at creation time
+    await close_shared_clients()
 
     return resolve_network_config(settings)
 
@@ -108,6 +111,7 @@ async def reset_proxy_override(
 
     # Clear our managed env vars so the process stops using the override
     apply_proxy_to_os_environ(ProxySettings(proxy_override=False))
+    await close_shared_clients()
 
     return resolve_network_config(settings)
 
@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.jwt import (
     UserInfo,
@@ -51,6 +51,8 @@ async def resolve_owned_registry(
 class CreateRegistryRequest(BaseModel):
     """Payload to create a new external registry entry."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     host: str
     username: str = ""
@@ -63,6 +65,8 @@ class CreateRegistryRequest(BaseModel):
 class UpdateRegistryRequest(BaseModel):
     """Payload to update an external registry entry (all fields optional)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str | None = None
     host: str | None = None
     username: str | None = None
@@ -75,6 +79,8 @@ class UpdateRegistryRequest(BaseModel):
 class TestConnectionRequest(BaseModel):
     """Payload to test connectivity to a registry without saving it."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     host: str
     username: str = ""
     password: str = ""
@@ -10,14 +10,20 @@ Authentication accepted:
   - Bearer JWT (web UI session token)
 """
 
+import asyncio
 import base64
 import json
 import logging
 import time
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
 
 import httpx
 from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import StreamingResponse
 from jose import JWTError, jwt
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
 
 from ..config import REGISTRY_URL, get_settings
 from ..core.jwt import ALGORITHM, is_admin_user, is_user_disabled
@@ -25,6 +31,7 @@ from ..routers.folders import check_folder_access
 from ..routers.personal_tokens import SCOPE_DOCKER, verify_personal_token
 from ..security import client_ip
 from ..services.audit_service import AuditService
+from ..services.providers.base import invalidate_catalog_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +39,18 @@ router = APIRouter()
 settings = get_settings()
 audit = AuditService(settings)
 
+# Lowercase byte keys, matched directly against the ASGI raw header list.
 _HOP_BY_HOP = frozenset(
     [
-        "connection",
-        "keep-alive",
-        "proxy-authenticate",
-        "proxy-authorization",
-        "te",
-        "trailers",
-        "transfer-encoding",
-        "upgrade",
-        "host",
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailers",
+        b"transfer-encoding",
+        b"upgrade",
+        b"host",
     ]
 )
 _PROXY_TIMEOUT: float = 300.0
@@ -52,29 +60,109 @@ _OCI_ACCEPT_TYPES = (
     "application/vnd.oci.image.manifest.v1+json",
     "application/vnd.oci.image.index.v1+json",
 )
+_OCI_ACCEPT_HEADER = ", ".join(_OCI_ACCEPT_TYPES).encode("latin-1")
+
+# ── Upstream connection pool ──────────────────────────────────────────────────
+# A single docker pull fans out into dozens of blob requests, so every proxied
+# call reuses one pooled client to the embedded registry instead of opening a
+# fresh connection each time. The registry is always local: the outbound proxy
+# environment is deliberately ignored (trust_env=False), which also means the
+# client never has to be rebuilt when the proxy settings change. Created lazily
+# and closed by the application lifespan.
+_PROXY_LIMITS = httpx.Limits(
+    max_connections=256, max_keepalive_connections=64, keepalive_expiry=60.0
+)
+_proxy_client: httpx.AsyncClient | None = None
+
+# ── Pull/push audit queue ─────────────────────────────────────────────────────
+# registry_pull / registry_push events are handed to a background worker so the
+# proxied response never waits on the audit file write. The queue is bounded:
+# when the worker falls behind, new events are dropped with a warning rather
+# than letting memory grow without limit.
+_AUDIT_QUEUE_MAX = 10_000
+_audit_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAX)
 
 
 # ─── Internal helpers ─────────────────────────────────────────────────────────
 
 
-def _filter_headers(headers: dict[str, str]) -> dict[str, str]:
-    """Remove HTTP hop-by-hop headers before forwarding."""
-    return {k: v for k, v in headers.items() if k.lower() not in _HOP_BY_HOP}
+def _get_proxy_client() -> httpx.AsyncClient:
+    """Return the pooled client used to reach the embedded registry."""
+    global _proxy_client
+    if _proxy_client is None or _proxy_client.is_closed:
+        _proxy_client = httpx.AsyncClient(
+            timeout=_PROXY_TIMEOUT,
+            follow_redirects=False,
+            limits=_PROXY_LIMITS,
+            trust_env=False,
+        )
+    return _proxy_client
+
+
+async def close_proxy_client() -> None:
+    """Close the pooled registry client; the next proxied call reopens one."""
+    global _proxy_client
+    client, _proxy_client = _proxy_client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _filter_headers_raw(
+    raw: Iterable[tuple[bytes, bytes]],
+) -> list[tuple[bytes, bytes]]:
+    """Remove HTTP hop-by-hop headers from a raw (lowercase key) header list."""
+    return [(k, v) for k, v in raw if k not in _HOP_BY_HOP]
 
 
 def _ensure_oci_accept_for_manifests(
-    v2_path: str, method: str, headers: dict[str, str]
+    v2_path: str, method: str, headers: list[tuple[bytes, bytes]]
 ) -> None:
     """Ensure manifest requests advertise OCI media types to the upstream registry."""
     if method not in _PULL_METHODS or "/manifests/" not in v2_path:
         return
-    accept_value = headers.get("accept")
-    if not accept_value:
-        headers["accept"] = ", ".join(_OCI_ACCEPT_TYPES)
+    for index, (key, value) in enumerate(headers):
+        if key != b"accept":
+            continue
+        if not value:
+            headers[index] = (key, _OCI_ACCEPT_HEADER)
+            return
+        accept_value = value.decode("latin-1")
+        missing = [m for m in _OCI_ACCEPT_TYPES if m not in accept_value.lower()]
+        if missing:
+            headers[index] = (
+                key,
+                f"{accept_value}, {', '.join(missing)}".encode("latin-1"),
+            )
         return
-    missing = [m for m in _OCI_ACCEPT_TYPES if m not in accept_value.lower()]
-    if missing:
-        headers["accept"] = f"{accept_value}, {', '.join(missing)}"
+    headers.append((b"accept", _OCI_ACCEPT_HEADER))
+
+
+def _enqueue_audit(**event: Any) -> None:
+    """Queue a pull/push audit event for the background worker."""
+    try:
+        _audit_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning(
+            "Audit queue full, dropping %s event for %s",
+            event.get("subject"),
+            event.get("path"),
+        )
+
+
+async def audit_worker() -> None:
+    """Write queued pull/push audit events until cancelled.
+
+    Started by the application lifespan. On cancellation the events already
+    queued are written before the task exits.
+    """
+    try:
+        while True:
+            event = await _audit_queue.get()
+            await audit.log(**event)
+    except asyncio.CancelledError:
+        while not _audit_queue.empty():
+            await audit.log(**_audit_queue.get_nowait())
+        raise
 
 
 async def _unauthorized_response(detail: str = "Authentication required") -> Response:
@@ -282,25 +370,44 @@ async def _proxy(request: Request, v2_path: str) -> Response:
     if authz_error is not None:
         return authz_error
 
-    req_headers = _filter_headers(dict(request.headers))
-    req_headers.pop("host", None)
+    # Starlette already exposes the request headers with lowercase byte keys.
+    req_headers = _filter_headers_raw(request.headers.raw)
     _ensure_oci_accept_for_manifests(
         v2_path=v2_path, method=method, headers=req_headers
     )
 
-    body = await request.body()
+    # Blob uploads can be several GB, so a push body is streamed to the
+    # registry (and counted for the audit log) instead of being read first.
+    pushed = 0
+
+    async def _request_body() -> AsyncIterator[bytes]:
+        nonlocal pushed
+        async for chunk in request.stream():
+            pushed += len(chunk)
+            yield chunk
+
+    content: bytes | AsyncIterator[bytes]
+    if method in _PUSH_METHODS and (
+        "content-length" in request.headers or "transfer-encoding" in request.headers
+    ):
+        content = _request_body()
+    else:
+        content = await request.body()
+        pushed = len(content)
+
     t0 = time.monotonic()
 
+    client = _get_proxy_client()
     try:
-        async with httpx.AsyncClient(
-            timeout=_PROXY_TIMEOUT, follow_redirects=False
-        ) as client:
-            upstream = await client.request(
+        upstream = await client.send(
+            client.build_request(
                 method=method,
                 url=upstream_url,
                 headers=req_headers,
-                content=body,
-            )
+                content=content,
+            ),
+            stream=True,
+        )
     except httpx.ConnectError as exc:
         logger.error("Registry unreachable at %s: %s", upstream_url, exc)
         return Response(
@@ -316,38 +423,128 @@ async def _proxy(request: Request, v2_path: str) -> Response:
             media_type="application/json",
         )
 
-    elapsed = time.monotonic() - t0
+    # The upstream connection is checked out of the shared pool until the
+    # response is closed: release it on every path, not only once the body
+    # has been relayed.
+    try:
+        return _relay_upstream(request, v2_path, method, upstream, pushed, t0)
+    except BaseException:
+        await upstream.aclose()
+        raise
+
+
+def _relay_upstream(
+    request: Request,
+    v2_path: str,
+    method: str,
+    upstream: httpx.Response,
+    pushed: int,
+    t0: float,
+) -> Response:
+    """Build the streaming response relaying *upstream* and queue its audit event."""
+    # httpx keeps the registry's header casing; ASGI expects lowercase names.
+    resp_headers = _filter_headers_raw((k.lower(), v) for k, v in upstream.headers.raw)
 
+    # Rewrite Location header so redirects point to the public host
+    for index, (key, value) in enumerate(resp_headers):
+        if key == b"location":
+            public_base = str(request.base_url).rstrip("/")
+            internal_base = REGISTRY_URL.rstrip("/")
+            loc = value.decode("latin-1").replace(internal_base, public_base)
+            resp_headers[index] = (key, loc.encode("latin-1"))
+
+    # Pushes are sized by the streamed request body. GET pulls are sized by the
+    # upstream Content-Length; HEAD probes transfer no body and log 0 bytes.
+    # A GET without Content-Length (chunked) is sized by counting the bytes
+    # actually streamed and logged once the transfer is over.
+    audit_kwargs: dict[str, Any] = {
+        "path": v2_path,
+        "method": method,
+        "client_ip": audit.client_ip,
+        "username": audit.username,
+    }
+    pending_pull_log = False
     if method in _PULL_METHODS:
-        await audit.log(
-            subject="registry_pull",
-            status=upstream.status_code,
-            size=len(upstream.content),
-            elapsed=elapsed,
-        )
+        content_length = upstream.headers.get("content-length")
+        if method == "HEAD" or (
+            content_length is not None and content_length.isdigit()
+        ):
+            _enqueue_audit(
+                subject="registry_pull",
+                status=upstream.status_code,
+                size=0 if method == "HEAD" else int(content_length or 0),
+                elapsed=time.monotonic() - t0,
+                **audit_kwargs,
+            )
+        else:
+            pending_pull_log = True
     elif method in _PUSH_METHODS:
-        await audit.log(
+        # A manifest PUT / DELETE adds or removes a tag: drop the cached catalog
+        # so the Images view shows it without waiting for the TTL.
+        if "/manifests/" in v2_path and upstream.status_code < 400:
+            invalidate_catalog_cache()
+        _enqueue_audit(
             subject="registry_push",
             status=upstream.status_code,
-            size=len(body),
-            elapsed=elapsed,
+            size=pushed,
+            elapsed=time.monotonic() - t0,
+            **audit_kwargs,
         )
 
-    resp_headers = _filter_headers(dict(upstream.headers))
-
-    # Rewrite Location header so redirects point to the public host
-    if "location" in resp_headers:
-        loc = resp_headers["location"]
-        public_base = str(request.base_url).rstrip("/")
-        internal_base = REGISTRY_URL.rstrip("/")
-        resp_headers["location"] = loc.replace(internal_base, public_base)
+    sent = 0
+    finished = False
+
+    async def _finish() -> None:
+        """Release the upstream connection and log a chunked pull (once)."""
+        nonlocal finished
+        if finished:
+            return
+        finished = True
+        await upstream.aclose()
+        if pending_pull_log:
+            _enqueue_audit(
+                subject="registry_pull",
+                status=upstream.status_code,
+                size=sent,
+                elapsed=time.monotonic() - t0,
+                **audit_kwargs,
+            )
 
-    return Response(
-        content=upstream.content,
+    async def _relay() -> AsyncIterator[bytes]:
+        """Yield the upstream body as it arrives, then release the connection."""
+        nonlocal sent
+        try:
+            async for chunk in upstream.aiter_raw():
+                sent += len(chunk)
+                yield chunk
+        finally:
+            await _finish()
+
+    response = _RelayResponse(
+        _relay(),
         status_code=upstream.status_code,
-        headers=resp_headers,
-        media_type=resp_headers.get("content-type"),
+        background=BackgroundTask(_finish),
     )
+    # Forward the upstream headers verbatim, repeated ones (e.g. Link) included.
+    response.raw_headers = resp_headers
+    return response
+
+
+class _RelayResponse(StreamingResponse):
+    """StreamingResponse that runs its background task even on failure.
+
+    Starlette skips the background task when sending fails, e.g. when the
+    client disconnects before the body iterator is started; the relay relies
+    on it to return the upstream connection to the pool.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        except BaseException:
+            if self.background is not None:
+                await self.background()
+            raise
 
 
 # ─── Routes ───────────────────────────────────────────────────────────────────
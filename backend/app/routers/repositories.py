@@ -66,6 +66,9 @@ async def list_images(
     search: str | None = Query(None, description="Filter repositories by name"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=5, le=200),
+    include_tags: bool = Query(
+        True, description="Resolve tags for each repository on the page"
+    ),
     current_user: UserInfo = Depends(get_current_user),
     _: dict[str, Any] = Depends(resolve_owned_registry),
 ) -> dict[str, Any]:
@@ -95,6 +98,7 @@ async def list_images(
             page=page,
             page_size=page_size,
             repo_filter=repo_filter,
+            include_tags=include_tags,
         )
     except _REGISTRY_ERRORS as exc:
         logger.warning("list_images: registry unreachable id=%s: %s", registry_id, exc)
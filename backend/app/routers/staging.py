@@ -13,7 +13,7 @@ import httpx
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from ..config import DEFAULT_TIMEOUT, REGISTRY_HOST, Settings, get_settings
+from ..config import DEFAULT_TIMEOUT, REGISTRY_HOST, get_settings
 from ..core.jwt import UserInfo, is_admin_user, require_pull_access, require_push_access
 from ..helpers import is_local_registry_host
 from ..routers.folders import (
@@ -32,10 +32,14 @@ from ..services.job_service import (
     safe_job_path,
 )
 from ..services.providers import build_target_path, resolve_provider_from_registry
+from ..services.providers.base import invalidate_catalog_cache
 from ..services.registries_service import get_registry_for_user
 from ..services.repositories_service import skopeo_copy_oci_image
 
 router = APIRouter()
+# Settings are a process-wide singleton: bind them once instead of resolving a
+# Depends(get_settings) on every pull / push request.
+settings = get_settings()
 
 _logger = logging.getLogger(__name__)
 
@@ -165,7 +169,6 @@ def _resolve_pull_source(
 async def pull_image(
     request: PullRequest,
     background_tasks: BackgroundTasks,
-    settings: Settings = Depends(get_settings),
     current_user: UserInfo = Depends(require_pull_access),
 ) -> StagingJob:
     """
@@ -244,7 +247,6 @@ async def pull_image(
 async def push_image(
     request: PushRequest,
     background_tasks: BackgroundTasks,
-    settings: Settings = Depends(get_settings),
     current_user: UserInfo = Depends(require_push_access),
 ) -> dict[str, Any]:
     """
@@ -270,6 +272,16 @@ async def push_image(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
+    # A single stat on the OCI index fails fast when the staged layout is gone
+    # (deleted job, wiped staging volume) instead of letting skopeo fail later.
+    try:
+        (oci_dir / "index.json").stat()
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Staged image layout not found",
+        )
+
     target_image = request.target_image or job["image"]
     target_tag = request.target_tag or job["tag"]
     folder = request.folder or ""
@@ -354,6 +366,7 @@ async def push_image(
             tls_verify=effective_tls_verify,
         )
         if success:
+            invalidate_catalog_cache()
             job["status"] = JobStatus.DONE
             job["message"] = f"✅ Successfully pushed to {dest_ref}"
             job["target_image"] = external_target_image
@@ -481,10 +494,12 @@ async def list_jobs(
     current_user: UserInfo = Depends(require_pull_access),
 ) -> list[StagingJob]:
     """Return all staging jobs visible to the current user."""
+    # Job records are written only by this service with already-typed values,
+    # so the polled job endpoints build responses without re-validating them.
     if current_user.is_admin:
-        return [StagingJob(**j) for j in jobs_list.values()]
+        return [StagingJob.model_construct(**j) for j in jobs_list.values()]
     return [
-        StagingJob(**j)
+        StagingJob.model_construct(**j)
         for j in jobs_list.values()
         if j.get("owner") == current_user.username
     ]
@@ -504,7 +519,7 @@ async def get_job(
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
         )
-    return StagingJob(**job)
+    return StagingJob.model_construct(**job)
 
 
 @router.delete("/jobs/{job_id}")
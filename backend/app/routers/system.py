@@ -19,6 +19,7 @@ Endpoints:
 import asyncio
 import logging
 import shutil
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 
@@ -31,6 +32,7 @@ from ..helpers import bytes_to_human
 from ..services.audit_service import get_recent_audit_events
 from ..services.job_service import jobs_list
 from ..services.process_manager import get_all_process_statuses
+from ..services.providers.base import invalidate_catalog_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -42,6 +44,10 @@ REGISTRY_BINARY = "/usr/local/bin/registry"
 REGISTRY_CONFIG = "/etc/registry/config.yml"
 REGISTRY_DATA_DIR = f"{DATA_DIR}/registry"
 SUPERVISORD_RPC_URL = "http://127.0.0.1:9001/RPC2"
+# Only the tail of the garbage-collect log is kept in the in-memory GC state.
+GC_OUTPUT_MAX_LINES = 500
+# Per-line read limit for the GC output pipes (asyncio defaults to 64 KiB).
+GC_STREAM_LIMIT = 1024 * 1024
 
 
 # ── Pydantic models ───────────────────────────────────────────────────────────
@@ -76,7 +82,11 @@ class GCStatus(BaseModel):
 
 # ── In-memory GC state ────────────────────────────────────────────────────────
 
-_gc_state: dict[str, Any] = GCStatus(
+# The current / last run is held as a GCStatus instance and updated in place
+# by _run_gc, so GET /gc polls read plain attributes. start_garbage_collect
+# checks and switches the state to running without awaiting in between, so
+# two concurrent requests cannot both start a run.
+_gc_state = GCStatus(
     status="idle",
     started_at=None,
     finished_at=None,
@@ -84,7 +94,10 @@ _gc_state: dict[str, Any] = GCStatus(
     freed_bytes=0,
     freed_human="0 B",
     error=None,
-).model_dump()
+)
+# Tail of the running GC's log. Lines are only appended while the GC runs;
+# get_gc_status joins them when polled and _run_gc stores the final text.
+_gc_output_lines: deque[str] = deque(maxlen=GC_OUTPUT_MAX_LINES)
 
 
 # ── Process status ─────────────────────────────────────────────────────────────
@@ -147,33 +160,39 @@ async def purge_orphan_oci(_: UserInfo = Depends(require_admin)) -> dict[str, An
 # ── Garbage collection ─────────────────────────────────────────────────────────
 
 
+async def _drain_gc_stream(
+    stream: asyncio.StreamReader | None, sink: deque[str]
+) -> None:
+    """Append each line of a GC subprocess stream to *sink* as it arrives."""
+    if stream is None:
+        return
+    async for raw in stream:
+        sink.append(raw.decode(errors="replace").rstrip("\n"))
+
+
 async def _run_gc(dry_run: bool) -> None:
-    """Run registry garbage-collect inside the container via supervisord."""
-    import xmlrpc.client
+    """Run registry garbage-collect inside the container via supervisord.
 
-    global _gc_state
-    _gc_state = GCStatus(
-        status="running",
-        started_at=datetime.now(UTC).isoformat(),
-        finished_at=None,
-        output="Garbage collection started...",
-        freed_bytes=0,
-        freed_human="0 B",
-        error=None,
-    ).model_dump()
+    The GC state has already been switched to running by start_garbage_collect.
+    """
+    import xmlrpc.client
 
-    output_lines: list[str] = []
+    output_lines = _gc_output_lines
 
     try:
         try:
-            size_before: int = shutil.disk_usage(REGISTRY_DATA_DIR).used
+            # statvfs can block for a while on network-backed storage, so the
+            # measurements run in a worker thread rather than on the event loop.
+            size_before: int = (
+                await asyncio.to_thread(shutil.disk_usage, REGISTRY_DATA_DIR)
+            ).used
         except Exception:
             size_before = 0
 
         proxy = xmlrpc.client.ServerProxy(SUPERVISORD_RPC_URL)
         output_lines.append("Stopping registry process via supervisord...")
         try:
-            proxy.supervisor.stopProcess("registry")
+            await asyncio.to_thread(proxy.supervisor.stopProcess, "registry")
             await asyncio.sleep(2)
             output_lines.append("Registry stopped.")
         except Exception as exc:
@@ -190,11 +209,23 @@ async def _run_gc(dry_run: bool) -> None:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=GC_STREAM_LIMIT,
             )
-            gc_out, gc_err = await proc.communicate()
-            output_lines.append(gc_out.decode())
-            if gc_err.decode().strip():
-                output_lines.append(gc_err.decode())
+            # Stream both pipes instead of buffering the whole (possibly very
+            # large) garbage-collect log with communicate(). If draining fails
+            # (e.g. a line longer than the reader limit), the process is killed
+            # before the registry is restarted on the same storage.
+            try:
+                await asyncio.gather(
+                    _drain_gc_stream(proc.stdout, output_lines),
+                    _drain_gc_stream(proc.stderr, output_lines),
+                )
+            except BaseException:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+            await proc.wait()
 
             if proc.returncode != 0:
                 raise RuntimeError(
@@ -204,31 +235,34 @@ async def _run_gc(dry_run: bool) -> None:
 
         finally:
             try:
-                proxy.supervisor.startProcess("registry")
+                await asyncio.to_thread(proxy.supervisor.startProcess, "registry")
                 output_lines.append("Registry restarted.")
             except Exception as exc:
                 output_lines.append(f"Warning: could not restart registry: {exc}")
 
         try:
-            size_after: int = shutil.disk_usage(REGISTRY_DATA_DIR).used
+            size_after: int = (
+                await asyncio.to_thread(shutil.disk_usage, REGISTRY_DATA_DIR)
+            ).used
             freed: int = max(0, size_before - size_after)
         except Exception:
             freed = 0
 
-        _gc_state["freed_bytes"] = freed
-        _gc_state["freed_human"] = bytes_to_human(freed)
-        _gc_state["output"] = "\n".join(output_lines).strip()
-        _gc_state["status"] = "done"
-        _gc_state["finished_at"] = datetime.now(UTC).isoformat()
-        _gc_state = GCStatus.model_validate(_gc_state).model_dump()
+        # Garbage collection can drop repositories from the catalog.
+        invalidate_catalog_cache()
+
+        _gc_state.freed_bytes = freed
+        _gc_state.freed_human = bytes_to_human(freed)
+        _gc_state.output = "\n".join(output_lines).strip()
+        _gc_state.status = "done"
+        _gc_state.finished_at = datetime.now(UTC).isoformat()
 
     except Exception:
         logger.exception("GC failed")
-        _gc_state["status"] = "failed"
-        _gc_state["error"] = "Garbage collection failed — check server logs"
-        _gc_state["output"] = "\n".join(output_lines).strip()
-        _gc_state["finished_at"] = datetime.now(UTC).isoformat()
-        _gc_state = GCStatus.model_validate(_gc_state).model_dump()
+        _gc_state.status = "failed"
+        _gc_state.error = "Garbage collection failed — check server logs"
+        _gc_state.output = "\n".join(output_lines).strip()
+        _gc_state.finished_at = datetime.now(UTC).isoformat()
 
 
 @router.post("/gc", response_model=GCStatus)
@@ -238,13 +272,13 @@ async def start_garbage_collect(
     _: UserInfo = Depends(require_admin),
 ) -> GCStatus:
     """Trigger a registry garbage-collect run (one job at a time)."""
-    if _gc_state["status"] == "running":
+    global _gc_state
+    if _gc_state.status == "running":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A garbage-collect is already running",
         )
-    background_tasks.add_task(_run_gc, dry_run)
-    return GCStatus(
+    _gc_state = GCStatus(
         status="running",
         started_at=datetime.now(UTC).isoformat(),
         finished_at=None,
@@ -253,17 +287,16 @@ async def start_garbage_collect(
         freed_human="0 B",
         error=None,
     )
+    # Cleared here rather than in _run_gc so GET /gc never reports the
+    # previous run's log before the background task starts.
+    _gc_output_lines.clear()
+    background_tasks.add_task(_run_gc, dry_run)
+    return _gc_state.model_copy()
 
 
 @router.get("/gc", response_model=GCStatus)
 async def get_gc_status(_: UserInfo = Depends(require_admin)) -> GCStatus:
     """Get the current or last garbage-collect job status."""
-    return GCStatus(
-        status=_gc_state["status"],
-        started_at=_gc_state["started_at"],
-        finished_at=_gc_state["finished_at"],
-        output=_gc_state["output"],
-        freed_bytes=int(_gc_state["freed_bytes"]),
-        freed_human=bytes_to_human(int(_gc_state["freed_bytes"])),
-        error=_gc_state["error"],
-    )
+    if _gc_state.status == "running" and _gc_output_lines:
+        return _gc_state.model_copy(update={"output": "\n".join(_gc_output_lines)})
+    return _gc_state.model_copy()
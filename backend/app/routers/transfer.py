@@ -19,7 +19,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from ..config import Settings, get_settings
+from ..config import get_settings
 from ..core.jwt import UserInfo, get_current_user, require_push_access
 from ..helpers import is_local_registry_host
 from ..routers.folders import (
@@ -39,6 +39,8 @@ from ..services.transfer_service import (
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+# Bound once at import: the transfer endpoint never needs request-scoped settings.
+settings = get_settings()
 
 
 def _resolves_to_local_registry(
@@ -67,7 +69,6 @@ def _resolves_to_local_registry(
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def start_transfer(
     request: TransferRequest,
-    settings: Settings = Depends(get_settings),
     current_user: UserInfo = Depends(require_push_access),
 ) -> dict[str, Any]:
     """
@@ -55,6 +55,8 @@ _recent_audit_events: deque[dict[str, Any]] = deque(maxlen=_audit_max_events)
 _audit_events_lock = Lock()
 _AUDIT_FILE_PATH = Path(f"{DATA_DIR}/audit-events.jsonl")
 _AUDIT_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+# Lines currently in the audit file, counted on the first write.
+_audit_file_lines: int | None = None
 
 
 def _set_audit_max_events(max_events: int) -> None:
@@ -66,16 +68,23 @@ def _set_audit_max_events(max_events: int) -> None:
         _recent_audit_events = deque(_recent_audit_events, maxlen=_audit_max_events)
 
 
-def _trim_audit_file(max_events: int) -> None:
-    events = _read_recent_events_from_disk(limit=max_events)
-    if not events:
-        if _AUDIT_FILE_PATH.exists():
-            _AUDIT_FILE_PATH.write_text("", encoding="utf-8")
-        return
+def _trim_audit_file(max_events: int) -> int:
+    """Keep only the last *max_events* lines of the audit file.
+
+    Lines are copied verbatim, so every entry keeps the serialization it was
+    written with. Returns the number of lines left in the file.
+    """
+    if not _AUDIT_FILE_PATH.exists():
+        return 0
+
+    with _AUDIT_FILE_PATH.open("r", encoding="utf-8") as file_obj:
+        lines: deque[str] = deque(
+            (line for line in file_obj if line.strip()), maxlen=max_events
+        )
 
     with _AUDIT_FILE_PATH.open("w", encoding="utf-8") as file_obj:
-        for event in events:
-            file_obj.write(f"{json.dumps(event)}\n")
+        file_obj.writelines(lines)
+    return len(lines)
 
 
 class AuditEvent(BaseModel):
@@ -92,16 +101,31 @@ class AuditEvent(BaseModel):
     auth_source: str | None = None
 
 
-def _store_recent_event(event: dict[str, Any]) -> None:
-    """Store an audit event in memory for live UI access."""
+def _store_recent_event(event: dict[str, Any], line: str) -> None:
+    """Store an audit event in memory for live UI access.
+
+    *line* is the event already serialized to JSON, appended as-is to the
+    audit file. The file is allowed to grow to twice the retention limit
+    before it is trimmed back, so the rewrite happens once every
+    _audit_max_events writes instead of on every event.
+    """
+    global _audit_file_lines
+
     with _audit_events_lock:
         _recent_audit_events.append(event)
         max_events = _audit_max_events
 
-    with _AUDIT_FILE_PATH.open("a", encoding="utf-8") as file_obj:
-        file_obj.write(f"{json.dumps(event)}\n")
+        with _AUDIT_FILE_PATH.open("a", encoding="utf-8") as file_obj:
+            file_obj.write(f"{line}\n")
 
-    _trim_audit_file(max_events=max_events)
+        if _audit_file_lines is None:
+            with _AUDIT_FILE_PATH.open("r", encoding="utf-8") as file_obj:
+                _audit_file_lines = sum(1 for _ in file_obj)
+        else:
+            _audit_file_lines += 1
+
+        if _audit_file_lines > 2 * max_events:
+            _audit_file_lines = _trim_audit_file(max_events=max_events)
 
 
 def _read_recent_events_from_disk(limit: int) -> list[dict[str, Any]]:
@@ -129,7 +153,8 @@ def get_recent_audit_events(limit: int = 200) -> list[dict[str, Any]]:
         in_memory_events = list(_recent_audit_events)
 
     if len(in_memory_events) < limit:
-        disk_events = _read_recent_events_from_disk(limit=limit)
+        # The file may hold up to twice the retention limit between trims.
+        disk_events = _read_recent_events_from_disk(limit=min(limit, _audit_max_events))
         if len(disk_events) > len(in_memory_events):
             in_memory_events = disk_events
 
@@ -178,7 +203,7 @@ class AuditService:
         auth_source: Authentication origin for web_login events ("local"/"oidc")
         """
 
-        event = AuditEvent(
+        audit_event = AuditEvent(
             event=subject,
             timestamp=datetime.now(UTC).isoformat(),
             path=path or self.path,
@@ -189,10 +214,14 @@ class AuditService:
             client_ip=client_ip or self.client_ip,
             username=username or self.username,
             auth_source=auth_source,
-        ).model_dump()
-
-        _store_recent_event(event)
-        audit_logger.info(json.dumps(event))
+        )
+        # Serialize once with Pydantic's JSON encoder and reuse the line for
+        # both the audit file and the audit logger.
+        line = audit_event.model_dump_json()
+        event = audit_event.model_dump()
+
+        _store_recent_event(event, line)
+        audit_logger.info(line)
         _dispatch_email_notification(event, self.settings)
 
 
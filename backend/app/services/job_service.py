@@ -17,6 +17,7 @@ from ..services.trivy_service import (
     parse_trivy_output,
     trivy_raw_scan,
 )
+from .providers.base import invalidate_catalog_cache
 
 _logger = logging.getLogger(__name__)
 
@@ -38,6 +39,8 @@ class JobStatus(StrEnum):
 class StagingJob(BaseModel):
     """Staging pipeline job model."""
 
+    model_config = ConfigDict(frozen=True)
+
     job_id: str
     status: JobStatus
     image: str
@@ -341,6 +344,7 @@ async def run_push_pipeline(
         if push_proc.returncode != 0:
             raise Exception(f"skopeo copy (push) failed: {stderr.decode()}")
 
+        invalidate_catalog_cache()
         jobs_list[job_id]["status"] = JobStatus.DONE
         jobs_list[job_id]["message"] = (
             f"✅ Successfully pushed to {folder + '/' if folder else ''}{target_image}:{target_tag}"
@@ -1,3 +1,4 @@
+import asyncio
 import xmlrpc.client
 from typing import Any, cast
 
@@ -10,24 +11,42 @@ def _get_proxy() -> xmlrpc.client.ServerProxy:
     return xmlrpc.client.ServerProxy(SUPERVISOR_RPC_URL)
 
 
+def _fetch_all_process_info() -> list[dict[str, Any]]:
+    """Fetch every supervised process in one XML-RPC round-trip (blocking)."""
+    return cast(list[dict[str, Any]], _get_proxy().supervisor.getAllProcessInfo())
+
+
 async def get_all_process_statuses() -> list[dict[str, Any]]:
     """Returns the status of all monitored supervised processes."""
-    proxy = _get_proxy()
+    # A single getAllProcessInfo call replaces one getProcessInfo round-trip
+    # per process; the blocking XML-RPC client runs in a worker thread so the
+    # event loop is never stalled waiting on supervisord.
+    try:
+        infos = await asyncio.to_thread(_fetch_all_process_info)
+    except Exception as e:
+        return [
+            {"name": name, "running": False, "error": str(e)}
+            for name in MONITORED_PROCESSES
+        ]
+
+    by_name = {info.get("name"): info for info in infos}
     statuses: list[dict[str, Any]] = []
     for name in MONITORED_PROCESSES:
-        try:
-            info = cast(dict[str, Any], proxy.supervisor.getProcessInfo(name))
+        info = by_name.get(name)
+        if info is None:
             statuses.append(
-                {
-                    "name": info["name"],
-                    "running": info["statename"] == "RUNNING",
-                    "state": info["statename"],
-                    "pid": info.get("pid"),
-                    "uptime_seconds": info.get("now", 0) - info.get("start", 0)
-                    if info.get("start")
-                    else 0,
-                }
+                {"name": name, "running": False, "error": "Process not found"}
             )
-        except Exception as e:
-            statuses.append({"name": name, "running": False, "error": str(e)})
+            continue
+        statuses.append(
+            {
+                "name": info["name"],
+                "running": info["statename"] == "RUNNING",
+                "state": info["statename"],
+                "pid": info.get("pid"),
+                "uptime_seconds": info.get("now", 0) - info.get("start", 0)
+                if info.get("start")
+                else 0,
+            }
+        )
     return statuses
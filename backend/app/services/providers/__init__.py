@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, cast
 
 from ...config import REGISTRY_URL
@@ -15,6 +16,7 @@ def normalize_host(host: str) -> str:
     return host.lower().removeprefix("https://").removeprefix("http://").split("/")[0]
 
 
+@lru_cache(maxsize=64)
 def resolve_provider(
     host: str,
     username: str = "",
@@ -29,6 +31,10 @@ def resolve_provider(
         docker.io variants   -> DockerHubProvider
         everything else      -> V2Provider
 
+    Providers hold no per-request state (connections live in the shared pool),
+    so instances are memoised per configuration, like get_settings(), instead
+    of being rebuilt on every API call.
+
     Args:
         host:       Registry hostname (bare or with scheme).
         username:   Registry username or GitHub owner.
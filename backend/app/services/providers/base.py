@@ -13,14 +13,84 @@ Provider hierarchy:
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any
 
+import httpx
 from httpx import HTTPStatusError
 
 logger = logging.getLogger(__name__)
 
+# ── Shared connection pool ────────────────────────────────────────────────────
+# httpx applies ``verify`` per client, so one pooled client is kept per verify
+# mode. Connectivity probes reuse them so repeated tests against the same
+# registry skip the TCP + TLS handshake. Clients are created lazily and closed
+# by the application lifespan, or whenever the outbound proxy changes (httpx
+# reads the proxy environment variables once, at client creation). Cookies are
+# never stored: the same client talks to many registries on behalf of many users.
+# V2Provider routes all of its registry calls through this pool, including
+# wide tag fan-outs, so the connection count is left unbounded (as it was with
+# one client per call) to avoid pool timeouts; only idle keep-alives are capped.
+_SHARED_LIMITS = httpx.Limits(max_connections=None, max_keepalive_connections=50)
+_shared_clients: dict[bool, httpx.AsyncClient] = {}
+
+
+def get_shared_client(verify: bool) -> httpx.AsyncClient:
+    """Return the process-wide pooled client for the given TLS verify mode."""
+    client = _shared_clients.get(verify)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=verify,
+            follow_redirects=True,
+            limits=_SHARED_LIMITS,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _shared_clients[verify] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every pooled client; the next call to get_shared_client reopens one."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# ── Catalog cache ─────────────────────────────────────────────────────────────
+# The repository catalog used for paged browsing is cached at module level,
+# keyed by (host, username, page_size), so registries reached through several
+# provider instances (saved registry, ad-hoc host, local) share one entry.
+# Every page of the Images view then slices the same list instead of walking
+# the registry catalog again. Entries expire after a short TTL and are dropped
+# explicitly by the tag / repository mutations, by garbage collection and by
+# every image Portalcrane writes itself (staging and transfer pushes, manifest
+# PUT / DELETE through the /v2 proxy).
+# A lowercased copy of the names is stored next to each catalog so the search
+# filter does not call .lower() on every repository for every keystroke.
+# Per-repository tag lists fetched for a page are memoised the same way, with
+# a shorter TTL, keyed by (host, username, repository).
+_CATALOG_CACHE_TTL = 30.0
+_TAGS_CACHE_TTL = 10.0
+_catalog_cache: dict[tuple[str, str, int], tuple[float, list[str], list[str]]] = {}
+_catalog_locks: dict[tuple[str, str, int], asyncio.Lock] = {}
+_tags_cache: dict[tuple[str, str, str], tuple[float, list[str]]] = {}
+
+
+def invalidate_catalog_cache(host: str | None = None) -> None:
+    """Drop cached catalogs and tag lists for *host*, or for every registry."""
+    if host is None:
+        _catalog_cache.clear()
+        _tags_cache.clear()
+        return
+    for catalog_key in [k for k in _catalog_cache if k[0] == host]:
+        _catalog_cache.pop(catalog_key, None)
+    for tags_key in [k for k in _tags_cache if k[0] == host]:
+        _tags_cache.pop(tags_key, None)
+
 
 class BaseRegistryProvider(ABC):
     """Abstract base class for all external registry providers.
@@ -185,6 +255,7 @@ class BaseRegistryProvider(ABC):
         page: int = 1,
         page_size: int = 20,
         repo_filter: Callable[[str], bool] | None = None,
+        include_tags: bool = True,
     ) -> dict[str, Any]:
         """List repositories/images available in this registry.
 
@@ -208,14 +279,14 @@ class BaseRegistryProvider(ABC):
                          before pagination; only names returning True are kept.
                          Used to enforce per-user folder access so total /
                          total_pages stay consistent with the visible items.
+            include_tags: When False, skip the per-repository tag lookups and
+                         return empty "tags" / zero "tag_count" for each item.
 
         Returns:
             dict[str, Any]: Paginated repository list.
         """
         try:
-            repositories = await self.list_repositories(
-                page_size=page_size, include_empty=True
-            )
+            repositories, lowered = await self._cached_catalog(page_size)
         except HTTPStatusError as exc:
             logger.warning("HTTP %s for host=%s", exc.response.status_code, self.host)
             return {
@@ -237,23 +308,36 @@ class BaseRegistryProvider(ABC):
                 "error": str(exc),
             }
 
-        # Apply search filter
-        if search:
-            repositories = [r for r in repositories if search.lower() in r.lower()]
-
-        # Apply per-user access filter (e.g. folder permissions) before paging
-        if repo_filter is not None:
-            repositories = [r for r in repositories if repo_filter(r)]
+        # Apply the search filter and the per-user access filter (e.g. folder
+        # permissions) in one pass before paging. The cheap substring test on
+        # the cached lowercase name runs first, so repo_filter only sees matches.
+        if search or repo_filter is not None:
+            needle = search.lower() if search else ""
+            repositories = [
+                r
+                for r, low in zip(repositories, lowered)
+                if needle in low and (repo_filter is None or repo_filter(r))
+            ]
 
         # ── Build paginated response ───────────────────────────────────────────
         total = len(repositories)
         total_pages = max(1, (total + page_size - 1) // page_size)
         start = (page - 1) * page_size
+
+        # No match, or a page past the end: nothing to slice or look up.
+        if start >= total:
+            return {
+                "items": [],
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
+                "error": None,
+            }
+
         page_repos = repositories[start : start + page_size]
 
-        tags_results: list[list[str]] = await asyncio.gather(
-            *[self.browse_tags(r) for r in page_repos]
-        )
+        tags_results = await self._page_tags(page_repos, include_tags)
 
         items = [
             {
@@ -274,6 +358,59 @@ class BaseRegistryProvider(ABC):
             "error": None,
         }
 
+    async def _cached_catalog(self, page_size: int) -> tuple[list[str], list[str]]:
+        """Return list_repositories(include_empty=True) through the catalog cache.
+
+        The second list holds the same names lowercased, index-aligned with
+        the first, for case-insensitive search.
+
+        Concurrent misses for the same key wait on a shared lock so only one
+        catalog request reaches the registry. Empty results are not cached:
+        V2Provider returns [] when the registry is unreachable.
+        """
+        key = (self.host, self.username, page_size)
+        lock = _catalog_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = _catalog_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1], cached[2]
+            repositories = await self.list_repositories(
+                page_size=page_size, include_empty=True
+            )
+            lowered = [r.lower() for r in repositories]
+            if repositories:
+                _catalog_cache[key] = (
+                    time.monotonic() + _CATALOG_CACHE_TTL,
+                    repositories,
+                    lowered,
+                )
+            return repositories, lowered
+
+    async def cached_browse_tags(self, repository: str) -> list[str]:
+        """Return browse_tags(repository) through the short-lived tags cache.
+
+        Used for tag lists shown in listings; mutations through Portalcrane
+        invalidate it, pushes from docker clients show up within the TTL.
+        """
+        key = (self.host, self.username, repository)
+        cached = _tags_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        tags = await self.browse_tags(repository)
+        if isinstance(tags, list) and tags:
+            _tags_cache[key] = (time.monotonic() + _TAGS_CACHE_TTL, tags)
+        return tags
+
+    async def _page_tags(
+        self, page_repos: list[str], include_tags: bool
+    ) -> list[list[str]]:
+        """Fetch the tag lists for one page of repositories, or skip them."""
+        if not include_tags:
+            return [[] for _ in page_repos]
+        return list(
+            await asyncio.gather(*[self.cached_browse_tags(r) for r in page_repos])
+        )
+
     async def list_empty_repositories(self) -> list[str]:
         """Return repositories that have no tags (ghost entries).
 
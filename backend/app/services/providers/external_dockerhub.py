@@ -6,7 +6,7 @@ from typing import Any, cast
 
 import httpx
 
-from .base import BaseRegistryProvider
+from .base import BaseRegistryProvider, get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -172,11 +172,9 @@ class DockerHubProvider(BaseRegistryProvider):
     async def ping(self) -> bool:
         """Return True when the registry responds to the /v2/ ping endpoint."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                resp = await client.get(_HUB_API)
-                return resp.status_code in (200, 401)
+            client = get_shared_client(self.verify)
+            resp = await client.get(_HUB_API, timeout=self.probe_timeout)
+            return resp.status_code in (200, 401)
         except Exception:
             return False
 
@@ -193,55 +191,55 @@ class DockerHubProvider(BaseRegistryProvider):
         )
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                cred_resp = await client.post(f"{_HUB_API}/v2/users/login", json=auth)
-                if cred_resp.status_code == 200:
-                    if not has_credentials:
-                        return {
-                            "reachable": True,
-                            "auth_ok": True,
-                            "message": "Registry reachable (public)",
-                        }
-
-                    return {
-                        "reachable": True,
-                        "auth_ok": True,
-                        "message": "Registry reachable — credentials accepted",
-                    }
-
-                if cred_resp.status_code == 403:
+            client = get_shared_client(self.verify)
+            cred_resp = await client.post(
+                f"{_HUB_API}/v2/users/login", json=auth, timeout=self.probe_timeout
+            )
+            if cred_resp.status_code == 200:
+                if not has_credentials:
                     return {
                         "reachable": True,
                         "auth_ok": True,
-                        "message": (
-                            "Registry reachable — credentials accepted"
-                            " (catalog access restricted)"
-                        ),
+                        "message": "Registry reachable (public)",
                     }
 
-                if cred_resp.status_code == 401:
-                    return {
-                        "reachable": True,
-                        "auth_ok": False,
-                        "message": "Authentication failed — invalid username or password",
-                    }
+                return {
+                    "reachable": True,
+                    "auth_ok": True,
+                    "message": "Registry reachable — credentials accepted",
+                }
 
-                logger.debug(
-                    "test_dockerhub_connection: returned %s for host=%s; ",
-                    cred_resp.status_code,
-                    self.host,
-                )
+            if cred_resp.status_code == 403:
                 return {
                     "reachable": True,
-                    "auth_ok": False,
+                    "auth_ok": True,
                     "message": (
-                        f"Registry reachable but credential check inconclusive"
-                        f" (status {cred_resp.status_code})"
+                        "Registry reachable — credentials accepted"
+                        " (catalog access restricted)"
                     ),
                 }
 
+            if cred_resp.status_code == 401:
+                return {
+                    "reachable": True,
+                    "auth_ok": False,
+                    "message": "Authentication failed — invalid username or password",
+                }
+
+            logger.debug(
+                "test_dockerhub_connection: returned %s for host=%s; ",
+                cred_resp.status_code,
+                self.host,
+            )
+            return {
+                "reachable": True,
+                "auth_ok": False,
+                "message": (
+                    f"Registry reachable but credential check inconclusive"
+                    f" (status {cred_resp.status_code})"
+                ),
+            }
+
         except httpx.ConnectError:
             return {
                 "reachable": False,
@@ -7,7 +7,7 @@ from typing import Any, cast
 
 import httpx
 
-from .base import BaseRegistryProvider
+from .base import BaseRegistryProvider, get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -107,11 +107,11 @@ class GithubProvider(BaseRegistryProvider):
     async def ping(self) -> bool:
         """Return True when the registry responds to the /v2/ ping endpoint."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                resp = await client.get(f"{_GITHUB_API}/octocat/")
-                return resp.status_code in (200, 401)
+            client = get_shared_client(self.verify)
+            resp = await client.get(
+                f"{_GITHUB_API}/octocat/", timeout=self.probe_timeout
+            )
+            return resp.status_code in (200, 401)
         except Exception:
             return False
 
@@ -129,50 +129,50 @@ class GithubProvider(BaseRegistryProvider):
             }
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                cred_resp = await client.get(
-                    f"{_GITHUB_API}/user", headers=self._github_api_headers()
-                )
-                if cred_resp.status_code == 200:
-                    return {
-                        "reachable": True,
-                        "auth_ok": True,
-                        "message": "Registry reachable — credentials accepted",
-                    }
-
-                if cred_resp.status_code == 403:
-                    return {
-                        "reachable": True,
-                        "auth_ok": True,
-                        "message": (
-                            "Registry reachable — credentials accepted"
-                            " (catalog access restricted)"
-                        ),
-                    }
-
-                if cred_resp.status_code == 401:
-                    return {
-                        "reachable": True,
-                        "auth_ok": False,
-                        "message": "Authentication failed — invalid username or password",
-                    }
+            client = get_shared_client(self.verify)
+            cred_resp = await client.get(
+                f"{_GITHUB_API}/user",
+                headers=self._github_api_headers(),
+                timeout=self.probe_timeout,
+            )
+            if cred_resp.status_code == 200:
+                return {
+                    "reachable": True,
+                    "auth_ok": True,
+                    "message": "Registry reachable — credentials accepted",
+                }
 
-                logger.debug(
-                    "test_dockerhub_connection: returned %s for host=%s; ",
-                    cred_resp.status_code,
-                    self.host,
-                )
+            if cred_resp.status_code == 403:
                 return {
                     "reachable": True,
-                    "auth_ok": False,
+                    "auth_ok": True,
                     "message": (
-                        f"Registry reachable but credential check inconclusive"
-                        f" (status {cred_resp.status_code})"
+                        "Registry reachable — credentials accepted"
+                        " (catalog access restricted)"
                     ),
                 }
 
+            if cred_resp.status_code == 401:
+                return {
+                    "reachable": True,
+                    "auth_ok": False,
+                    "message": "Authentication failed — invalid username or password",
+                }
+
+            logger.debug(
+                "test_dockerhub_connection: returned %s for host=%s; ",
+                cred_resp.status_code,
+                self.host,
+            )
+            return {
+                "reachable": True,
+                "auth_ok": False,
+                "message": (
+                    f"Registry reachable but credential check inconclusive"
+                    f" (status {cred_resp.status_code})"
+                ),
+            }
+
         except httpx.ConnectError:
             return {
                 "reachable": False,
@@ -272,6 +272,7 @@ class GithubProvider(BaseRegistryProvider):
         page: int = 1,
         page_size: int = 20,
         repo_filter: Callable[[str], bool] | None = None,
+        include_tags: bool = True,
     ) -> dict[str, Any]:
         """
         List container packages for a GitHub user or organisation via the
@@ -314,23 +315,36 @@ class GithubProvider(BaseRegistryProvider):
                 "error": str(exc),
             }
 
-        # Apply search filter
-        if search:
-            repositories = [r for r in repositories if search.lower() in r.lower()]
-
-        # Apply per-user access filter (e.g. folder permissions) before paging
-        if repo_filter is not None:
-            repositories = [r for r in repositories if repo_filter(r)]
+        # Apply the search filter and the per-user access filter (e.g. folder
+        # permissions) in one pass before paging.
+        if search or repo_filter is not None:
+            needle = search.lower() if search else ""
+            repositories = [
+                r
+                for r in repositories
+                if (not needle or needle in r.lower())
+                and (repo_filter is None or repo_filter(r))
+            ]
 
         # ── Build paginated response ───────────────────────────────────────────
         total = len(repositories)
         total_pages = max(1, (total + page_size - 1) // page_size)
         start = (page - 1) * page_size
+
+        # No match, or a page past the end: nothing to slice or look up.
+        if start >= total:
+            return {
+                "items": [],
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
+                "error": None,
+            }
+
         page_repos = repositories[start : start + page_size]
 
-        tags_results: list[list[str]] = await asyncio.gather(
-            *[self.browse_tags(r) for r in page_repos]
-        )
+        tags_results = await self._page_tags(page_repos, include_tags)
 
         items = [
             {
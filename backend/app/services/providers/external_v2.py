@@ -24,11 +24,12 @@ Architecture decisions:
 import asyncio
 import json as _json
 import logging
+from collections import OrderedDict
 from typing import Any, cast
 
 import httpx
 
-from .base import BaseRegistryProvider
+from .base import BaseRegistryProvider, get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +51,28 @@ _MANIFEST_LIST_TYPES = frozenset(
     ]
 )
 
+# Bookkeeping keys get_manifest adds to the parsed manifest body.
+_MANIFEST_PRIVATE_KEYS = ("_digest", "_content_length", "_content_type")
+
 _DEFAULT_TIMEOUT = 30.0
 
+# Default Accept header sent with every registry request.
+_DEFAULT_ACCEPT = (
+    "application/vnd.docker.distribution.manifest.v2+json,application/json"
+)
+
 # Exceptions that indicate the registry is temporarily unreachable.
 _REGISTRY_CONNECT_ERRORS = (httpx.ConnectError, httpx.TimeoutException)
 
+# Upper bound on concurrent manifest requests issued by delete_repository.
+_DELETE_CONCURRENCY = 8
+
+# Image config blobs are content-addressed and therefore immutable: a small
+# LRU keyed by (host, digest) lets repeated tag-detail views skip the blob
+# fetch entirely.
+_CONFIG_CACHE_MAX_ENTRIES = 256
+_config_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
 
 class V2Provider(BaseRegistryProvider):
     """OCI Distribution Specification v2 provider.
@@ -96,19 +114,29 @@ class V2Provider(BaseRegistryProvider):
             return (self.username, self.password)
         return None
 
-    def _client(self, timeout: float | None = None) -> httpx.AsyncClient:
-        """Create an authenticated async HTTP client for registry calls."""
-        headers = {
-            "Accept": (
-                "application/vnd.docker.distribution.manifest.v2+json,application/json"
-            )
-        }
-        return httpx.AsyncClient(
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send an authenticated registry request over the shared pooled client.
+
+        Going through the process-wide pool lets consecutive calls (manifest
+        then config blob, tags for a page of repositories, ...) reuse warm
+        keep-alive connections instead of paying a TCP + TLS handshake each
+        time, and keeps connections alive across provider instances.
+        """
+        client = get_shared_client(self.verify)
+        return await client.request(
+            method,
+            url,
             auth=self._auth,
-            headers=headers,
+            headers={"Accept": _DEFAULT_ACCEPT, **(headers or {})},
             timeout=timeout if timeout is not None else self.timeout,
-            follow_redirects=True,
-            verify=self.verify,
+            **kwargs,
         )
 
     # ── Abstract implementations — connectivity ───────────────────────────────
@@ -116,75 +144,78 @@ class V2Provider(BaseRegistryProvider):
     async def ping(self) -> bool:
         """Return True when the registry responds to the /v2/ ping endpoint."""
         try:
-            async with self._client(timeout=self.probe_timeout) as client:
-                resp = await client.get(f"{self.base_url}/v2/")
-                return resp.status_code in (200, 401)
+            client = get_shared_client(self.verify)
+            resp = await client.get(
+                f"{self.base_url}/v2/", auth=self._auth, timeout=self.probe_timeout
+            )
+            return resp.status_code in (200, 401)
         except Exception:
             return False
 
     async def test_connection(self) -> dict[str, Any]:
         """Probe the registry to check reachability and validate credentials."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                ping_resp = await client.get(f"{self.base_url}/v2/")
-
-                if ping_resp.status_code not in (200, 401):
-                    return {
-                        "reachable": True,
-                        "auth_ok": False,
-                        "message": f"Unexpected status {ping_resp.status_code}",
-                    }
-
-                if not self.has_credentials:
-                    auth_ok = ping_resp.status_code == 200
-                    return {
-                        "reachable": True,
-                        "auth_ok": auth_ok,
-                        "message": (
-                            "Registry reachable (public)"
-                            if auth_ok
-                            else "Registry reachable — authentication required"
-                        ),
-                    }
-
-                cred_resp = await client.get(
-                    f"{self.base_url}/v2/",
-                    auth=(self.username, self.password),
-                )
-
-                if cred_resp.status_code == 200:
-                    return {
-                        "reachable": True,
-                        "auth_ok": True,
-                        "message": "Registry reachable — credentials accepted",
-                    }
-                if cred_resp.status_code == 403:
-                    return {
-                        "reachable": True,
-                        "auth_ok": True,
-                        "message": (
-                            "Registry reachable — credentials accepted"
-                            " (catalog access restricted)"
-                        ),
-                    }
-                if cred_resp.status_code == 401:
-                    return {
-                        "reachable": True,
-                        "auth_ok": False,
-                        "message": "Authentication failed — invalid username or password",
-                    }
+            client = get_shared_client(self.verify)
+            ping_resp = await client.get(
+                f"{self.base_url}/v2/", timeout=self.probe_timeout
+            )
 
+            if ping_resp.status_code not in (200, 401):
                 return {
                     "reachable": True,
                     "auth_ok": False,
+                    "message": f"Unexpected status {ping_resp.status_code}",
+                }
+
+            if not self.has_credentials:
+                auth_ok = ping_resp.status_code == 200
+                return {
+                    "reachable": True,
+                    "auth_ok": auth_ok,
                     "message": (
-                        f"Registry reachable but credential check inconclusive"
-                        f" (status {cred_resp.status_code})"
+                        "Registry reachable (public)"
+                        if auth_ok
+                        else "Registry reachable — authentication required"
                     ),
                 }
 
+            cred_resp = await client.get(
+                f"{self.base_url}/v2/",
+                auth=(self.username, self.password),
+                timeout=self.probe_timeout,
+            )
+
+            if cred_resp.status_code == 200:
+                return {
+                    "reachable": True,
+                    "auth_ok": True,
+                    "message": "Registry reachable — credentials accepted",
+                }
+            if cred_resp.status_code == 403:
+                return {
+                    "reachable": True,
+                    "auth_ok": True,
+                    "message": (
+                        "Registry reachable — credentials accepted"
+                        " (catalog access restricted)"
+                    ),
+                }
+            if cred_resp.status_code == 401:
+                return {
+                    "reachable": True,
+                    "auth_ok": False,
+                    "message": "Authentication failed — invalid username or password",
+                }
+
+            return {
+                "reachable": True,
+                "auth_ok": False,
+                "message": (
+                    f"Registry reachable but credential check inconclusive"
+                    f" (status {cred_resp.status_code})"
+                ),
+            }
+
         except httpx.ConnectError:
             return {
                 "reachable": False,
@@ -208,12 +239,12 @@ class V2Provider(BaseRegistryProvider):
     async def check_catalog(self) -> bool:
         """Return True when /v2/_catalog is accessible."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.probe_timeout, verify=self.verify, follow_redirects=True
-            ) as client:
-                resp = await client.get(
-                    f"{self.base_url}/v2/_catalog?n=1", auth=self._auth
-                )
+            client = get_shared_client(self.verify)
+            resp = await client.get(
+                f"{self.base_url}/v2/_catalog?n=1",
+                auth=self._auth,
+                timeout=self.probe_timeout,
+            )
             browsable = resp.status_code in (200, 401)
             logger.debug(
                 "check_catalog host=%s status=%s browsable=%s",
@@ -244,10 +275,9 @@ class V2Provider(BaseRegistryProvider):
             url += f"&last={last}"
 
         try:
-            async with self._client(timeout=self.catalog_timeout) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                repositories: list[str] = resp.json().get("repositories", [])
+            resp = await self._request("GET", url, timeout=self.catalog_timeout)
+            resp.raise_for_status()
+            repositories: list[str] = resp.json().get("repositories", [])
         except _REGISTRY_CONNECT_ERRORS as exc:
             logger.warning(
                 "list_repositories: registry unreachable host=%s: %s", self.host, exc
@@ -279,12 +309,15 @@ class V2Provider(BaseRegistryProvider):
     async def browse_tags(self, repository: str) -> list[str]:
         """List all tags for a repository via /v2/{repository}/tags/list."""
         try:
-            async with self._client(timeout=self.tags_timeout) as client:
-                resp = await client.get(f"{self.base_url}/v2/{repository}/tags/list")
-                if resp.status_code == 404:
-                    return []
-                resp.raise_for_status()
-                return resp.json().get("tags", []) or []
+            resp = await self._request(
+                "GET",
+                f"{self.base_url}/v2/{repository}/tags/list",
+                timeout=self.tags_timeout,
+            )
+            if resp.status_code == 404:
+                return []
+            resp.raise_for_status()
+            return resp.json().get("tags", []) or []
         except _REGISTRY_CONNECT_ERRORS as exc:
             logger.warning(
                 "browse_tags: registry unreachable host=%s repo=%s: %s",
@@ -302,22 +335,22 @@ class V2Provider(BaseRegistryProvider):
     async def get_manifest(self, repository: str, reference: str) -> dict[str, Any]:
         """Fetch a manifest by tag or digest."""
         try:
-            async with self._client(timeout=self.timeout) as client:
-                resp = await client.get(
-                    f"{self.base_url}/v2/{repository}/manifests/{reference}",
-                    headers={"Accept": _MANIFEST_ACCEPT},
-                )
-                if resp.status_code == 404:
-                    return {}
-                resp.raise_for_status()
-                manifest: dict[str, Any] = resp.json()
-                manifest["_digest"] = resp.headers.get("Docker-Content-Digest", "")
-                manifest["_content_length"] = int(resp.headers.get("Content-Length", 0))
-                manifest["_content_type"] = resp.headers.get(
-                    "Content-Type",
-                    "application/vnd.docker.distribution.manifest.v2+json",
-                )
-                return manifest
+            resp = await self._request(
+                "GET",
+                f"{self.base_url}/v2/{repository}/manifests/{reference}",
+                headers={"Accept": _MANIFEST_ACCEPT},
+            )
+            if resp.status_code == 404:
+                return {}
+            resp.raise_for_status()
+            manifest: dict[str, Any] = resp.json()
+            manifest["_digest"] = resp.headers.get("Docker-Content-Digest", "")
+            manifest["_content_length"] = int(resp.headers.get("Content-Length", 0))
+            manifest["_content_type"] = resp.headers.get(
+                "Content-Type",
+                "application/vnd.docker.distribution.manifest.v2+json",
+            )
+            return manifest
         except _REGISTRY_CONNECT_ERRORS as exc:
             logger.warning(
                 "get_manifest: registry unreachable host=%s repo=%s ref=%s: %s",
@@ -340,11 +373,12 @@ class V2Provider(BaseRegistryProvider):
     async def delete_manifest(self, repository: str, digest: str) -> bool:
         """Delete an image manifest by digest."""
         try:
-            async with self._client(timeout=self.manifest_timeout) as client:
-                resp = await client.delete(
-                    f"{self.base_url}/v2/{repository}/manifests/{digest}"
-                )
-                return resp.status_code in (200, 202)
+            resp = await self._request(
+                "DELETE",
+                f"{self.base_url}/v2/{repository}/manifests/{digest}",
+                timeout=self.manifest_timeout,
+            )
+            return resp.status_code in (200, 202)
         except Exception as exc:
             logger.warning(
                 "delete_manifest error host=%s repo=%s digest=%s: %s",
@@ -363,15 +397,17 @@ class V2Provider(BaseRegistryProvider):
         content_type: str,
     ) -> bool:
         """Push a manifest to create or update a tag."""
-        clean = {k: v for k, v in manifest.items() if not k.startswith("_")}
+        clean = manifest.copy()
+        for key in _MANIFEST_PRIVATE_KEYS:
+            clean.pop(key, None)
         try:
-            async with self._client(timeout=self.timeout) as client:
-                resp = await client.put(
-                    f"{self.base_url}/v2/{repository}/manifests/{reference}",
-                    content=_json.dumps(clean),
-                    headers={"Content-Type": content_type},
-                )
-                return resp.status_code in (200, 201)
+            resp = await self._request(
+                "PUT",
+                f"{self.base_url}/v2/{repository}/manifests/{reference}",
+                content=_json.dumps(clean),
+                headers={"Content-Type": content_type},
+            )
+            return resp.status_code in (200, 201)
         except Exception as exc:
             logger.warning(
                 "put_manifest error host=%s repo=%s ref=%s: %s",
@@ -384,15 +420,19 @@ class V2Provider(BaseRegistryProvider):
 
     async def get_image_config(self, repository: str, digest: str) -> dict[str, Any]:
         """Fetch an image configuration blob."""
+        key = (self.host, digest)
+        cached = _config_cache.get(key)
+        if cached is not None:
+            _config_cache.move_to_end(key)
+            return cached
         try:
-            async with self._client(timeout=self.timeout) as client:
-                resp = await client.get(
-                    f"{self.base_url}/v2/{repository}/blobs/{digest}"
-                )
-                if resp.status_code == 404:
-                    return {}
-                resp.raise_for_status()
-                return cast("dict[str, Any]", resp.json())
+            resp = await self._request(
+                "GET", f"{self.base_url}/v2/{repository}/blobs/{digest}"
+            )
+            if resp.status_code == 404:
+                return {}
+            resp.raise_for_status()
+            config = cast("dict[str, Any]", resp.json())
         except _REGISTRY_CONNECT_ERRORS as exc:
             logger.warning(
                 "get_image_config: registry unreachable host=%s repo=%s digest=%s: %s",
@@ -412,6 +452,12 @@ class V2Provider(BaseRegistryProvider):
             )
             return {}
 
+        if config:
+            _config_cache[key] = config
+            if len(_config_cache) > _CONFIG_CACHE_MAX_ENTRIES:
+                _config_cache.popitem(last=False)
+        return config
+
     async def get_tag_detail(self, repository: str, tag: str) -> dict[str, Any]:
         """Fetch detailed metadata for a specific tag."""
         manifest = await self.get_manifest(repository, tag)
@@ -463,38 +509,41 @@ class V2Provider(BaseRegistryProvider):
     ) -> dict[str, Any]:
         """Create a new tag by copying the raw manifest of an existing tag."""
         try:
-            async with self._client(timeout=self.manifest_timeout) as client:
-                manifest_resp = await client.get(
-                    f"{self.base_url}/v2/{repository}/manifests/{source_tag}",
-                    headers={"Accept": _MANIFEST_ACCEPT},
-                )
-                if manifest_resp.status_code == 404:
-                    return {
-                        "success": False,
-                        "message": f"Source tag '{source_tag}' not found",
-                    }
-                manifest_resp.raise_for_status()
-
-                content_type = manifest_resp.headers.get(
-                    "Content-Type",
-                    "application/vnd.docker.distribution.manifest.v2+json",
-                )
-                raw_manifest = manifest_resp.content
-
-                put_resp = await client.put(
-                    f"{self.base_url}/v2/{repository}/manifests/{new_tag}",
-                    content=raw_manifest,
-                    headers={"Content-Type": content_type},
-                )
-                if put_resp.status_code in (200, 201):
-                    return {
-                        "success": True,
-                        "message": f"Tag '{new_tag}' created from '{source_tag}'",
-                    }
+            manifest_resp = await self._request(
+                "GET",
+                f"{self.base_url}/v2/{repository}/manifests/{source_tag}",
+                timeout=self.manifest_timeout,
+                headers={"Accept": _MANIFEST_ACCEPT},
+            )
+            if manifest_resp.status_code == 404:
                 return {
                     "success": False,
-                    "message": f"Registry returned HTTP {put_resp.status_code}",
+                    "message": f"Source tag '{source_tag}' not found",
                 }
+            manifest_resp.raise_for_status()
+
+            content_type = manifest_resp.headers.get(
+                "Content-Type",
+                "application/vnd.docker.distribution.manifest.v2+json",
+            )
+            raw_manifest = manifest_resp.content
+
+            put_resp = await self._request(
+                "PUT",
+                f"{self.base_url}/v2/{repository}/manifests/{new_tag}",
+                timeout=self.manifest_timeout,
+                content=raw_manifest,
+                headers={"Content-Type": content_type},
+            )
+            if put_resp.status_code in (200, 201):
+                return {
+                    "success": True,
+                    "message": f"Tag '{new_tag}' created from '{source_tag}'",
+                }
+            return {
+                "success": False,
+                "message": f"Registry returned HTTP {put_resp.status_code}",
+            }
         except _REGISTRY_CONNECT_ERRORS as exc:
             logger.warning(
                 "add_tag: registry unreachable host=%s repo=%s src=%s new=%s: %s",
@@ -549,29 +598,44 @@ class V2Provider(BaseRegistryProvider):
 
         # Several tags can point to the same manifest digest. Deleting a digest
         # removes every tag referencing it at once, so resolve digests first and
-        # delete each unique digest only once to avoid spurious 404s.
-        deleted_digests: set[str] = set()
-        failed: list[str] = []
+        # delete each unique digest only once to avoid spurious 404s. Lookups
+        # and deletes run concurrently, bounded so that a repository with
+        # hundreds of tags does not flood the registry.
+        semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+
+        async def _resolve_digest(tag: str) -> str:
+            async with semaphore:
+                manifest = await self.get_manifest(repository, tag)
+            return manifest.get("_digest", "") if manifest else ""
+
+        async def _delete_digest(digest: str) -> bool:
+            async with semaphore:
+                return await self.delete_manifest(repository, digest)
+
+        digests = await asyncio.gather(*[_resolve_digest(tag) for tag in tags])
+
+        # Keep the first tag seen for each digest; tags whose manifest could
+        # not be resolved are already gone and are skipped.
+        tag_by_digest: dict[str, str] = {}
+        for tag, digest in zip(tags, digests):
+            if digest:
+                tag_by_digest.setdefault(digest, tag)
+
+        results = await asyncio.gather(
+            *[_delete_digest(digest) for digest in tag_by_digest]
+        )
 
-        for tag in tags:
-            manifest = await self.get_manifest(repository, tag)
-            digest = manifest.get("_digest", "") if manifest else ""
-            if not digest:
-                # Tag already gone (e.g. removed via a shared digest) — skip it.
-                continue
-            if digest in deleted_digests:
+        failed: list[str] = []
+        for (digest, tag), deleted in zip(tag_by_digest.items(), results):
+            if deleted:
                 continue
-
-            if await self.delete_manifest(repository, digest):
-                deleted_digests.add(digest)
-            else:
-                failed.append(tag)
-                logger.warning(
-                    "delete_repository: error deleting %s:%s (digest=%s)",
-                    repository,
-                    tag,
-                    digest,
-                )
+            failed.append(tag)
+            logger.warning(
+                "delete_repository: error deleting %s:%s (digest=%s)",
+                repository,
+                tag,
+                digest,
+            )
 
         return f"Failed to delete tags: {', '.join(failed)}" if failed else None
 
@@ -18,6 +18,7 @@ Local registry system entry:
 import json
 import logging
 import shutil
+import time
 import uuid
 from pathlib import Path
 from typing import Any
@@ -489,12 +490,24 @@ async def check_catalog_browsable(
     return await provider.check_catalog()
 
 
+# Ping results are reused for a few seconds so UI health polls from several
+# tabs / users collapse onto a single probe per registry.
+_PING_CACHE_TTL = 5.0
+_ping_cache: dict[str, tuple[float, bool]] = {}
+
+
 async def ping_catalog(registry_id: str) -> bool:
     """Check local registry connectivity."""
+    cached = _ping_cache.get(registry_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     registry = get_registry_by_id(registry_id)
     if not registry:
         raise ValueError(f"Registry {registry_id} not found")
 
     provider = resolve_provider_from_registry(registry)
 
-    return await provider.ping()
+    is_up = await provider.ping()
+    _ping_cache[registry_id] = (time.monotonic() + _PING_CACHE_TTL, is_up)
+    return is_up
@@ -10,10 +10,14 @@ from typing import Any
 
 from ..config import Settings
 from .providers import resolve_provider_from_registry
+from .providers.base import invalidate_catalog_cache
 from .registries_service import REGISTRY_REPOS_DIR, get_registry_by_id
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent directory removals in purge_registry.
+_PURGE_CONCURRENCY = 4
+
 
 async def purge_registry(registry_id: str) -> tuple[list[str], list[dict[str, Any]]]:
     """Purge ghost repositories directly from the local filesystem.
@@ -32,24 +36,41 @@ async def purge_registry(registry_id: str) -> tuple[list[str], list[dict[str, An
     if not empty:
         errors.append({"repo": "", "error": "No empty repositories found"})
 
-    for repo in empty:
-        repo_path = Path(REGISTRY_REPOS_DIR) / repo
+    base = Path(REGISTRY_REPOS_DIR).resolve()
+    # Directory removals run in worker threads, a few at a time, so a large
+    # purge neither blocks the event loop nor serialises every rmtree.
+    semaphore = asyncio.Semaphore(_PURGE_CONCURRENCY)
+
+    async def _purge(repo: str) -> str | None:
+        """Remove one repository directory; return an error message or None."""
         try:
-            resolved = repo_path.resolve()
-            base = Path(REGISTRY_REPOS_DIR).resolve()
+            resolved = (Path(REGISTRY_REPOS_DIR) / repo).resolve()
             if not str(resolved).startswith(str(base)):
-                errors.append({"repo": repo, "error": "Path traversal attempt blocked"})
-                continue
+                return "Path traversal attempt blocked"
             if resolved.exists():
-                shutil.rmtree(resolved)
-            purged.append(repo)
+                async with semaphore:
+                    await asyncio.to_thread(shutil.rmtree, resolved)
+            return None
         except OSError as exc:
             logger.error("Failed to purge repository %s: %s", repo, exc)
-            errors.append({"repo": repo, "error": "Deletion failed"})
+            return "Deletion failed"
         except Exception:
             logger.exception("Unexpected error purging repository %s", repo)
-            errors.append({"repo": repo, "error": "Unexpected error"})
+            return "Unexpected error"
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [(repo, tg.create_task(_purge(repo))) for repo in empty]
 
+    # Results are collected in catalog order once every removal has finished.
+    for repo, task in tasks:
+        error = task.result()
+        if error is None:
+            purged.append(repo)
+        else:
+            errors.append({"repo": repo, "error": error})
+
+    if purged:
+        invalidate_catalog_cache()
     return purged, errors
 
 
@@ -59,6 +80,7 @@ async def browse_images(
     page: int = 1,
     page_size: int = 20,
     repo_filter: Callable[[str], bool] | None = None,
+    include_tags: bool = True,
 ) -> dict[str, Any]:
     """List repositories available in an external registry.
 
@@ -72,6 +94,9 @@ async def browse_images(
     predicate are kept (applied before pagination, so total / total_pages stay
     consistent). Used to enforce per-user folder access.
 
+    When *include_tags* is False the per-repository tag lookups are skipped;
+    clients then fetch tags lazily through browse_tags.
+
     Returns a paginated dict compatible with the local PaginatedImages shape:
       { items, total, page, page_size, total_pages, error? }
     """
@@ -81,7 +106,11 @@ async def browse_images(
 
     provider = resolve_provider_from_registry(registry)
     return await provider.browse_repositories(
-        search=search, page=page, page_size=page_size, repo_filter=repo_filter
+        search=search,
+        page=page,
+        page_size=page_size,
+        repo_filter=repo_filter,
+        include_tags=include_tags,
     )
 
 
@@ -101,7 +130,7 @@ async def browse_tags(registry_id: str, repository: str) -> dict[str, Any]:
         raise ValueError(f"Registry {registry_id} not found")
 
     provider = resolve_provider_from_registry(registry)
-    tags = await provider.browse_tags(repository=repository)
+    tags = await provider.cached_browse_tags(repository)
 
     return {"repository": repository, "tags": tags}
 
@@ -118,6 +147,7 @@ async def remove_image(registry_id: str, repository: str) -> dict[str, Any]:
 
     provider = resolve_provider_from_registry(registry)
     error = await provider.delete_repository(repository)
+    invalidate_catalog_cache(provider.host)
 
     if error:
         return {
@@ -174,7 +204,9 @@ async def remove_tag(registry_id: str, repository: str, tag: str) -> dict[str, A
         raise ValueError(f"Registry {registry_id} not found")
 
     provider = resolve_provider_from_registry(registry)
-    return await provider.delete_tag(repository, tag)
+    result = await provider.delete_tag(repository, tag)
+    invalidate_catalog_cache(provider.host)
+    return result
 
 
 async def append_tag(
@@ -198,7 +230,9 @@ async def append_tag(
         raise ValueError(f"Registry {registry_id} not found")
 
     provider = resolve_provider_from_registry(registry)
-    return await provider.add_tag(repository, source_tag, new_tag)
+    result = await provider.add_tag(repository, source_tag, new_tag)
+    invalidate_catalog_cache(provider.host)
+    return result
 
 
 async def empty_tags(registry_id: str) -> list[str]:
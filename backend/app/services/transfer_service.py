@@ -20,6 +20,7 @@ import logging
 import os
 import shutil
 import uuid
+from collections.abc import Coroutine
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
@@ -27,8 +28,9 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from ..config import REGISTRY_HOST, REGISTRY_URL, Settings, staging_root
+from ..config import REGISTRY_HOST, REGISTRY_URL, Settings, get_settings, staging_root
 from ..services.providers import resolve_provider_from_registry
+from ..services.providers.base import invalidate_catalog_cache
 from ..services.registries_service import get_registry_by_id
 from ..services.trivy_service import (
     parse_trivy_output,
@@ -42,6 +44,11 @@ logger = logging.getLogger(__name__)
 
 _transfer_jobs: dict[str, dict[str, Any]] = {}
 
+# Worker slots shared by every transfer pipeline. A multi-image request fans out
+# one job per image; the semaphore keeps at most TRANSFER_PARALLELISM skopeo
+# pipelines running while the remaining jobs wait in the PENDING state.
+_transfer_slots = asyncio.Semaphore(max(1, get_settings().transfer_parallelism))
+
 
 class TransferStatus(StrEnum):
     """Transfer job status values."""
@@ -176,6 +183,21 @@ def delete_transfer_job(job_id: str) -> bool:
 # ── Core pipeline ─────────────────────────────────────────────────────────────
 
 
+async def _run_in_transfer_slot(
+    job_id: str, pipeline: Coroutine[Any, Any, None]
+) -> None:
+    """Run a transfer pipeline once a worker slot is available.
+
+    A job deleted while it was still waiting for a slot is skipped.
+    """
+    async with _transfer_slots:
+        if job_id not in _transfer_jobs:
+            pipeline.close()
+            logger.info("Transfer job %s was deleted before it started", job_id)
+            return
+        await pipeline
+
+
 async def _run_transfer_pipeline(
     job_id: str,
     settings: Settings,
@@ -319,6 +341,7 @@ async def _run_transfer_pipeline(
         if push_proc.returncode != 0:
             raise RuntimeError(f"skopeo push failed: {push_stderr.decode()}")
 
+        invalidate_catalog_cache()
         _update(
             TransferStatus.DONE,
             f"✅ Transferred to {dest_repository}:{dest_tag}",
@@ -426,17 +449,20 @@ async def start_transfer_jobs(
         }
 
         asyncio.create_task(
-            _run_transfer_pipeline(
-                job_id=job_id,
-                settings=settings,
-                source_registry_id=request.source_registry_id,
-                dest_registry_id=request.dest_registry_id,
-                repository=repository,
-                tag=tag,
-                dest_repository=dest_repo,
-                dest_tag=dest_tag,
-                vuln_scan_enabled_override=request.vuln_scan_enabled_override,
-                vuln_severities_override=request.vuln_severities_override,
+            _run_in_transfer_slot(
+                job_id,
+                _run_transfer_pipeline(
+                    job_id=job_id,
+                    settings=settings,
+                    source_registry_id=request.source_registry_id,
+                    dest_registry_id=request.dest_registry_id,
+                    repository=repository,
+                    tag=tag,
+                    dest_repository=dest_repo,
+                    dest_tag=dest_tag,
+                    vuln_scan_enabled_override=request.vuln_scan_enabled_override,
+                    vuln_severities_override=request.vuln_severities_override,
+                ),
             )
         )
 
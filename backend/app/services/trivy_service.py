@@ -23,6 +23,9 @@ _TRIVY_DB_METADATA = Path(f"{_TRIVY_CACHE_DIR}/db/metadata.json")
 _OVERRIDE_FILE = Path(DATA_DIR) / "vuln_override.json"
 _TRIVY_BINARY = "/usr/local/bin/trivy"
 _TRIVY_DB_REFRESH_INTERVAL = 86400
+# Precompiled patterns; the version one runs on raw bytes to skip decoding.
+_TRIVY_VERSION_RE = re.compile(rb"Version:\s*([^\s]+)")
+_EXPLICIT_TAG_OR_DIGEST_RE = re.compile(r"(:[^/]+$|@sha256:[a-f0-9]{64}$)")
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -110,6 +113,12 @@ def resolve_vuln_config(settings: Settings) -> dict[str, Any]:
 # ── Trivy DB helpers ──────────────────────────────────────────────────────────
 
 
+# The Trivy binary only changes with the container image, so its version is
+# read once per process instead of forking `trivy --version` on every
+# dashboard refresh. Failures are not cached and are retried on the next call.
+_trivy_version: str | None = None
+
+
 async def get_trivy_version() -> str | None:
     """Return the installed Trivy binary version (e.g. "0.72.3").
 
@@ -117,6 +126,9 @@ async def get_trivy_version() -> str | None:
     when the binary is missing or the call fails, so callers can degrade
     gracefully.
     """
+    global _trivy_version
+    if _trivy_version is not None:
+        return _trivy_version
     try:
         proc = await asyncio.create_subprocess_exec(
             _TRIVY_BINARY,
@@ -127,8 +139,10 @@ async def get_trivy_version() -> str | None:
         stdout, _ = await proc.communicate()
         if proc.returncode != 0:
             return None
-        match = re.search(r"Version:\s*([^\s]+)", stdout.decode())
-        return match.group(1) if match else None
+        match = _TRIVY_VERSION_RE.search(stdout)
+        if match:
+            _trivy_version = match.group(1).decode(errors="replace")
+        return _trivy_version
     except Exception as exc:  # binary missing or unexpected failure
         logger.warning("Unable to read Trivy version: %s", exc)
         return None
@@ -249,7 +263,7 @@ def effective_severities(settings: Settings, override: str | None) -> list[str]:
 
 def has_explicit_tag_or_digest(image: str) -> bool:
     """Return True when the image reference contains an explicit tag or digest."""
-    return bool(re.search(r"(:[^/]+$|@sha256:[a-f0-9]{64}$)", image))
+    return bool(_EXPLICIT_TAG_OR_DIGEST_RE.search(image))
 
 
 async def scan_image(